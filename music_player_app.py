@@ -2,54 +2,459 @@
 import sys
 import os
 import json
+import bisect
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
-    QLabel, QPushButton, QStackedWidget, QListWidgetItem, QSlider,
-    QSizePolicy
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListView,
+    QLabel, QPushButton, QStackedWidget, QSlider, QSizePolicy
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QThread, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractListModel, QModelIndex, QBuffer, QByteArray
+)
+from PyQt5.QtGui import (
+    QPixmap, QImageReader, QFont, QColor, QPainter, QGuiApplication
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QFont, QColor, QPainter, QGuiApplication
 import vlc
 from mutagen import File
+from mutagen.easymp4 import EasyMP4
 from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
+from mutagen.id3 import ID3
+from mutagen.mp4 import MP4
+
+try:
+    import orjson  # Optional; a faster drop-in for the JSON data files
+except ImportError:
+    orjson = None
+
+
+AUDIO_EXTENSIONS = ('.flac', '.mp3', '.m4a', '.ogg')
+# Matched against the lowercased suffix only, never a copy of the whole name
+_AUDIO_EXT = frozenset(AUDIO_EXTENSIONS)
+
+# Thumbnail/metadata/trash folders created by NAS boxes and desktop OSes.
+# Hidden (dot) folders are skipped as well.
+SKIPPED_DIRS = frozenset({
+    '@eaDir', '#recycle', '#snapshot', '__MACOSX',
+    '$RECYCLE.BIN', 'System Volume Information',
+})
+
+
+def dump_json(obj):
+    """Serialize obj to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects the surrogate escapes that non-UTF-8 file
+            # names decode to; json escapes them as \udcXX instead
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+def load_json(data):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # Including the \udcXX escapes dump_json falls back to, which
+            # orjson refuses as lone surrogates
+            pass
+    return json.loads(data)
+
+
+def write_atomic(path, data):
+    """Write bytes through a temp file and rename, so a crash never leaves a partial file."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def id3_text(audio, key, default):
+    """Return the first text value of an ID3 frame with a single lookup."""
+    frame = audio.get(key)
+    if frame is not None and getattr(frame, 'text', None):
+        return str(frame.text[0])
+    return default
+
+
+# Folder -> cover image path, or None when the folder has none
+_folder_art_paths = {}
+
+
+@functools.lru_cache(maxsize=8)
+def load_art(path):
+    """Read album art for path on demand.
+
+    Art is not kept in the scanned metadata; it is only read when a
+    view actually shows it. The last few results are kept so showing
+    one album at several sizes reads the file once.
+    """
+    art = None
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == '.flac':
+            audio = FLAC(path)
+            if audio.pictures:
+                art = audio.pictures[0].data
+        elif ext == '.mp3':
+            apic_frames = ID3(path).getall('APIC')
+            if apic_frames:
+                art = apic_frames[0].data
+        elif ext == '.m4a':
+            audio = MP4(path)
+            covers = audio.tags.get('covr') if audio is not None and audio.tags else None
+            if covers:
+                art = bytes(covers[0])
+    except Exception:
+        pass
+
+    return art or load_folder_art(path)
+
+
+def load_folder_art(path):
+    folder = os.path.dirname(path)
+    # Every track of an album shares its folder; list it only once
+    if folder in _folder_art_paths:
+        file_path = _folder_art_paths[folder]
+    else:
+        file_path = find_folder_art(folder)
+        _folder_art_paths[folder] = file_path
+    if file_path is None:
+        return None
+
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def find_folder_art(folder):
+    candidates = [
+        "cover.jpg", "cover.png",
+        "folder.jpg", "folder.png",
+        "front.jpg", "front.png",
+        "album.jpg", "album.png",
+        "artwork.jpg", "artwork.png"
+    ]
+
+    try:
+        with os.scandir(folder) as it:
+            lookup = {
+                entry.name.lower(): entry.path
+                for entry in it if entry.is_file()
+            }
+    except Exception:
+        return None
+
+    for name in candidates:
+        if name in lookup:
+            return lookup[name]
+    return None
+
+
+def decode_art(data, size):
+    """Decode image bytes for display at up to size x size.
+
+    Covers larger than 2x the target are decoded straight at that size,
+    which lets the JPEG decoder skip most of the work. Returns a null
+    QImage when the data can't be decoded.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    reader = QImageReader(buffer)
+    source = reader.size()
+    if source.isValid() and (source.width() > size * 2 or source.height() > size * 2):
+        reader.setScaledSize(source.scaled(size * 2, size * 2, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+@functools.lru_cache(maxsize=4096)
+def format_seconds(s):
+    """m:ss for a playback position; keyed by whole seconds so replays hit."""
+    return f"{s//60}:{s%60:02d}"
+
+
+def scale_art(image, size):
+    """Scale a QImage/QPixmap to fit size x size.
+
+    Sources much larger than the target (e.g. 3000px embedded covers) are
+    first cut down to 2x with a fast pass, so the smooth filter only runs
+    over a small image.
+    """
+    if image.width() > size * 2 or image.height() > size * 2:
+        image = image.scaled(size * 2, size * 2, Qt.KeepAspectRatio,
+                             Qt.FastTransformation)
+    return image.scaled(size, size, Qt.KeepAspectRatio,
+                        Qt.SmoothTransformation)
+
+
+class RowListModel(QAbstractListModel):
+    """Flat list model of (text, data) rows; data is exposed as Qt.UserRole."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        # Scan batches re-render the visible page even when it didn't change;
+        # a reset would repaint the view and drop its current index
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, value = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return value
+        return None
+
+
+class FileWriteSignals(QObject):
+    # snapshot passed to the task, whether the write succeeded
+    finished = pyqtSignal(object, bool)
+
+
+class FileWriteTask(QRunnable):
+    """Writes an already serialized payload to disk on a pool thread.
+
+    snapshot is handed back through signals.finished so the UI thread
+    knows which state reached the disk.
+    """
+
+    def __init__(self, path, data, snapshot=None):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.snapshot = snapshot
+        self.signals = FileWriteSignals()
+
+    def run(self):
+        try:
+            write_atomic(self.path, self.data)
+        except OSError:
+            self.signals.finished.emit(self.snapshot, False)
+        else:
+            self.signals.finished.emit(self.snapshot, True)
+
+
+class ArtPrefetchSignals(QObject):
+    # album, {size: QImage or None when the album has no art}
+    loaded = pyqtSignal(str, dict)
+
+
+class ArtPrefetchTask(QRunnable):
+    """Reads and scales album art on a pool thread.
+
+    Only QImage is used here; turning it into a QPixmap has to happen on
+    the UI thread.
+    """
+
+    def __init__(self, album, path, sizes):
+        super().__init__()
+        self.album = album
+        self.path = path
+        self.sizes = sizes
+        self.signals = ArtPrefetchSignals()
+
+    def run(self):
+        images = dict.fromkeys(self.sizes)
+        art = load_art(self.path)
+        if art:
+            image = decode_art(art, max(self.sizes))
+            if not image.isNull():
+                for size in self.sizes:
+                    images[size] = scale_art(image, size)
+        self.signals.loaded.emit(self.album, images)
+
+
+class ScannerWorker(QObject):
+    """Walks the music folder off the UI thread and emits parsed tracks in batches."""
+    batch_ready = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    BATCH_SIZE = 50
+    # Tag parsing is dominated by file reads, so oversubscribe the cores
+    MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+    def __init__(self, music_root, load_cache, parse, save_cache):
+        super().__init__()
+        self.music_root = music_root
+        self.load_cache = load_cache
+        self.parse = parse
+        self.save_cache = save_cache
+        self._stopped = False
+        self._batch = []
+        self._scanned = []
+
+    def stop(self):
+        self._stopped = True
+
+    def run(self):
+        cached_tracks = self.load_cache()
+        pending = []
+
+        for entry in self._iter_audio_files():
+            path = entry.path
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stamp = [st.st_mtime, st.st_size]
+
+            # Reuse cached tags unless the file changed since last scan
+            cached = cached_tracks.get(path)
+            if cached and cached.get('stamp') == stamp:
+                self._collect((path, stamp, cached['meta']))
+            else:
+                pending.append((path, stamp))
+
+        if self._stopped:
+            self.finished.emit()
+            return
+
+        # get_metadata only reads the file, so new files can be parsed concurrently
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as ex:
+            metas = ex.map(self.parse, [path for path, _ in pending])
+            for (path, stamp), meta in zip(pending, metas):
+                if self._stopped:
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    self.finished.emit()
+                    return
+                self._collect((path, stamp, meta))
+
+        self._flush()
+        # Every file was a cache hit and none disappeared: nothing to write
+        if pending or len(self._scanned) != len(cached_tracks):
+            self.save_cache(self._scanned)
+        self.finished.emit()
+
+    def _iter_audio_files(self):
+        """Yield a DirEntry for every audio file below music_root.
+
+        Uses os.scandir so file/dir checks come from the directory listing
+        instead of extra stat calls.
+        """
+        stack = [self.music_root]
+        while stack and not self._stopped:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    # Also drops macOS "._name.mp3" resource-fork files
+                    if name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIPPED_DIRS:
+                                stack.append(entry.path)
+                        elif name[name.rfind('.'):].lower() in _AUDIO_EXT:
+                            yield entry
+                    except OSError:
+                        continue
+
+    def _collect(self, entry):
+        self._batch.append(entry)
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self.batch_ready.emit(self._batch)
+            self._scanned.extend(self._batch)
+            self._batch = []
 
 
 class MusicPlayerApp(QWidget):
+    # Emitted from libVLC's event thread; delivered queued on the UI thread
+    track_finished = pyqtSignal()
+    time_changed = pyqtSignal(int)
+
     def __init__(self, music_root):
         super().__init__()
         self.music_root = music_root
         self.favorites_file = os.path.expanduser("~/.music_player_favorites.json")
+        self.library_cache_file = os.path.expanduser("~/.music_player_library.json")
 
         # Landscape screen dimensions
         self.SCREEN_WIDTH = 480
         self.SCREEN_HEIGHT = 270
 
-        # VLC
-        self.instance = vlc.Instance(["--aout=alsa", "--alsa-audio-device=hw:1,0"])
-        self.player = self.instance.media_player_new()
+        # VLC: loading libVLC and probing its plugins is slow on the target,
+        # so it happens on a thread while the UI is built (see init_vlc)
+        self.track_finished.connect(self.next_track)
+        self.time_changed.connect(self.update_progress)
+        self.time_tick = -1
         self.volume = self.get_system_volume()
-        self.player.audio_set_volume(self.volume)
+        self.vlc_ready = threading.Event()
+        self.vlc_error = None
+        threading.Thread(target=self.init_vlc, daemon=True).start()
         self.theme = "light"
         
         # Playback state
         self.is_playing_music = False
+        self.shown_length = -1
+        self.shown_second = -1
+        self.length_text = "0:00"
 
         # Data
         self.albums = {}
-        self.album_metadata = {}
+        self.album_artists = {}
+        self.album_art_paths = {}
+        # "Album\nArtist", as shown in album lists and the detail header
+        self.album_labels = {}
         self.artists = {}
-        self.favorites = self.load_favorites()
+        # Artist -> sorted album rows for its album list, built on first view
+        self.artist_album_rows = {}
+        self.track_metadata = {}
+
+        # Coalesce rapid favorite toggles into one write
+        self.favorites_save_timer = QTimer(self)
+        self.favorites_save_timer.setSingleShot(True)
+        self.favorites_save_timer.timeout.connect(self.save_favorites)
+        # One writer thread, so saves land in order and an older list never
+        # replaces a newer one
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        # Favorites known to be on disk, and the last set handed to save_pool
+        self.saved_favorites = frozenset()
+        self.queued_favorites = frozenset()
 
         self.current_tracks = []
         self.current_album = None
         self.current_index = -1
-        self.track_ending = False
-        self.now_playing_sidebars = []
-        self.sidebar_play_buttons = []
-        self.side_stacks = []
         self.artist_list_mode = "artists"
         self.current_artist = None
+        self.detail_return_index = 1
+        self.scan_thread = None
+        self.scan_worker = None
+
+        # Scaled album art, keyed by (album, size), least recently used first
+        self.art_cache = OrderedDict()
+        self.art_cache_size = 32
+        self.placeholder_cache = {}
+        # (album, size) keys being decoded on the thread pool
+        self.art_loading = set()
+        # Label -> the (album, size) it should show once decoded
+        self.art_targets = {}
 
         # Pagination state
         self.albums_per_page = 5
@@ -58,23 +463,28 @@ class MusicPlayerApp(QWidget):
         self.tracks_per_page = 7
         self.album_page = 0
         self.artist_page = 0
-        self.favorites_page = 0
+        self.favorites_page_index = 0
         self.track_page = 0
         self.all_albums = []
         self.all_artists = []
+        # Favorites that are in the scanned library, sorted
+        self.all_favorites = []
         self.all_tracks_data = []
 
         # Set fixed size for landscape display
         self.setFixedSize(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         self.setWindowTitle("Music Player")
 
+        self.key_actions = {
+            Qt.Key_Escape: self.close,
+            Qt.Key_Space: self.toggle_play,
+        }
+
         self.set_minimal_theme()
         self.init_ui()
-        self.scan_music_library()
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(500)
+        # Start the scan from the event loop so the first paint isn't
+        # competing with the worker parsing the library cache
+        QTimer.singleShot(0, self.scan_music_library)
 
     # ---------- Helper methods ----------
     def scaled(self, px):
@@ -84,6 +494,44 @@ class MusicPlayerApp(QWidget):
     def touch_height(self):
         return 22
 
+    def init_vlc(self):
+        # Always release waiters; a failure is re-raised on first use below
+        try:
+            instance = vlc.Instance(["--aout=alsa", "--alsa-audio-device=hw:1,0"])
+            if instance is None:
+                raise RuntimeError("libVLC could not be initialised")
+            player = instance.media_player_new()
+            em = player.event_manager()
+            em.event_attach(
+                vlc.EventType.MediaPlayerEndReached,
+                lambda event: self.track_finished.emit()
+            )
+            em.event_attach(
+                vlc.EventType.MediaPlayerTimeChanged, self.on_vlc_time_changed
+            )
+            player.audio_set_volume(self.volume)
+            self._instance = instance
+            self._player = player
+        except Exception as e:
+            self.vlc_error = e
+        finally:
+            self.vlc_ready.set()
+
+    def wait_for_vlc(self):
+        self.vlc_ready.wait()
+        if self.vlc_error is not None:
+            raise RuntimeError(f"VLC failed to start: {self.vlc_error}") from self.vlc_error
+
+    @property
+    def instance(self):
+        self.wait_for_vlc()
+        return self._instance
+
+    @property
+    def player(self):
+        self.wait_for_vlc()
+        return self._player
+
     def get_system_volume(self):
         """Get current system volume (Windows) or default to 70"""
         try:
@@ -172,18 +620,18 @@ class MusicPlayerApp(QWidget):
             font-size: 11px;
         }}
 
-        QListWidget {{
+        QListView {{
             border: none;
             padding: 2px;
             outline: none;
         }}
 
-        QListWidget::item {{
+        QListView::item {{
             padding: 6px 10px;
             border-bottom: 1px solid {list_item_border};
         }}
 
-        QListWidget::item:selected {{
+        QListView::item:selected {{
             background-color: {selected_bg};
             color: {fg};
         }}
@@ -200,13 +648,32 @@ class MusicPlayerApp(QWidget):
             color: #555555;
         }}
 
-        QPushButton#accent {{
+        QPushButton#accent, QPushButton#play {{
             background-color: transparent;
             color: {accent};
             border: none;
             font-weight: 600;
         }}
 
+        QPushButton#play {{
+            border-radius: 20px;
+            font-size: 15px;
+        }}
+
+        QPushButton#transport {{
+            border-radius: 18px;
+            font-size: 13px;
+        }}
+
+        QPushButton#sidebar_control {{
+            border-radius: 6px;
+            font-size: 11px;
+        }}
+
+        QPushButton#favorite {{
+            font-size: 16px;
+        }}
+
         QPushButton#volume {{
             background-color: {volume_bg};
             border: 1px solid {volume_border};
@@ -220,7 +687,7 @@ class MusicPlayerApp(QWidget):
             background-color: {border};
         }}
 
-        QPushButton#accent:pressed {{
+        QPushButton#accent:pressed, QPushButton#play:pressed {{
             color: {accent_pressed};
         }}
 
@@ -240,6 +707,53 @@ class MusicPlayerApp(QWidget):
             font-size: 10px;
         }}
 
+        QLabel#header_title {{
+            font-size: 12px;
+            font-weight: 600;
+        }}
+
+        QLabel#detail_title {{
+            font-size: 11px;
+            font-weight: 600;
+        }}
+
+        QLabel#preview_title {{
+            font-size: 13px;
+            font-weight: 600;
+        }}
+
+        QLabel#preview_artist {{
+            color: #666;
+            font-size: 11px;
+        }}
+
+        QLabel#now_playing_title {{
+            font-size: 14px;
+            font-weight: 600;
+            padding-right: 6px;
+        }}
+
+        QLabel#sidebar_caption {{
+            color: #888;
+            font-size: 9px;
+            letter-spacing: 0.5px;
+        }}
+
+        QLabel#sidebar_artist {{
+            color: #777;
+            font-size: 10px;
+        }}
+
+        QLabel#page_label {{
+            color: #666;
+            font-size: 10px;
+        }}
+
+        QLabel#time_label {{
+            color: #888;
+            font-size: 10px;
+        }}
+
         QSlider::groove:horizontal {{
             height: 4px;
             background: {slider_bg};
@@ -286,7 +800,16 @@ class MusicPlayerApp(QWidget):
         ]:
             self.stack.addWidget(p)
 
-        self.update_side_views()
+        # A single now-playing sidebar, moved into whichever page is showing
+        self.now_playing_sidebar = self.create_now_playing_sidebar()
+        self.side_stacks = {
+            self.landing_page: self.landing_side_stack,
+            self.albums_page: self.album_side_stack,
+            self.favorites_page: self.favorites_side_stack,
+        }
+        self.stack.currentChanged.connect(self.dock_now_playing_sidebar)
+        self.stack.currentChanged.connect(self.refresh_progress)
+        self.dock_now_playing_sidebar()
 
     def create_header(self, title, back_action):
         header = QWidget()
@@ -301,7 +824,7 @@ class MusicPlayerApp(QWidget):
 
         label = QLabel(title)
         label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("font-size: 12px; font-weight: 600;")
+        label.setObjectName("header_title")
         layout.addWidget(label, 1)
 
         spacer = QLabel()
@@ -311,7 +834,6 @@ class MusicPlayerApp(QWidget):
 
     def create_now_playing_sidebar(self):
         container = QWidget()
-        container.setStyleSheet("background-color: #ffffff;")
         container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         layout = QVBoxLayout(container)
@@ -319,7 +841,7 @@ class MusicPlayerApp(QWidget):
         layout.setSpacing(6)
 
         title = QLabel("Now Playing")
-        title.setStyleSheet("font-size: 9px; color: #888; letter-spacing: 0.5px;")
+        title.setObjectName("sidebar_caption")
         layout.addWidget(title)
 
         art = QLabel()
@@ -329,12 +851,12 @@ class MusicPlayerApp(QWidget):
 
         track = QLabel("Nothing playing")
         track.setWordWrap(True)
-        track.setStyleSheet("font-size: 13px; font-weight: 600;")
+        track.setObjectName("preview_title")
         layout.addWidget(track)
 
         artist = QLabel("")
         artist.setWordWrap(True)
-        artist.setStyleSheet("font-size: 10px; color: #777;")
+        artist.setObjectName("sidebar_artist")
         layout.addWidget(artist)
 
         controls = QHBoxLayout()
@@ -346,7 +868,7 @@ class MusicPlayerApp(QWidget):
 
         for btn in [prev_btn, play_btn, next_btn]:
             btn.setFixedSize(28, 24)
-            btn.setStyleSheet("border-radius: 6px; font-size: 11px;")
+            btn.setObjectName("sidebar_control")
 
         prev_btn.clicked.connect(self.prev_track)
         play_btn.clicked.connect(self.toggle_play)
@@ -357,13 +879,11 @@ class MusicPlayerApp(QWidget):
         controls.addWidget(next_btn)
         layout.addLayout(controls)
 
-        self.now_playing_sidebars.append({
-            "art": art,
-            "track": track,
-            "artist": artist
-        })
-        self.sidebar_play_buttons.append(play_btn)
-        self.set_preview_art(art, None, 180)
+        self.sidebar_art = art
+        self.sidebar_track = track
+        self.sidebar_artist = artist
+        self.sidebar_play_btn = play_btn
+        self.set_preview_art(art, None, None, 180)
 
         return container
 
@@ -381,7 +901,6 @@ class MusicPlayerApp(QWidget):
         page_label = QLabel("Page 1/1")
         page_label.setObjectName("page_label")
         page_label.setAlignment(Qt.AlignCenter)
-        page_label.setStyleSheet("font-size: 10px; color: #666;")
         layout.addWidget(page_label, 1)
 
         next_btn = QPushButton("Next ›")
@@ -389,7 +908,7 @@ class MusicPlayerApp(QWidget):
         next_btn.clicked.connect(next_action)
         layout.addWidget(next_btn)
 
-        return footer
+        return footer, page_label
 
     def create_landing_page(self):
         page = QWidget()
@@ -405,9 +924,9 @@ class MusicPlayerApp(QWidget):
         title.setObjectName("landing_title")
         left_col.addWidget(title)
 
-        tagline = QLabel("Your library, wide view")
-        tagline.setObjectName("landing_tagline")
-        left_col.addWidget(tagline)
+        self.landing_tagline = QLabel("Your library, wide view")
+        self.landing_tagline.setObjectName("landing_tagline")
+        left_col.addWidget(self.landing_tagline)
 
         volume_row = QHBoxLayout()
         volume_row.setSpacing(6)
@@ -450,13 +969,9 @@ class MusicPlayerApp(QWidget):
         btn_exit.clicked.connect(self.close)
         left_col.addWidget(btn_exit)
 
-        # Now playing sidebar on landing page
-        landing_now_playing = self.create_now_playing_sidebar()
+        # Now playing sidebar is docked here while the landing page shows
         self.landing_side_stack = QStackedWidget()
         self.landing_side_stack.addWidget(QWidget())  # Empty widget when not playing
-        self.landing_side_stack.addWidget(landing_now_playing)
-        self.landing_side_stack.setCurrentIndex(0)
-        self.side_stacks.append(self.landing_side_stack)
 
         right_col = QVBoxLayout()
         right_col.setSpacing(10)
@@ -500,11 +1015,14 @@ class MusicPlayerApp(QWidget):
             "Albums", lambda: self.stack.setCurrentIndex(0)
         ))
 
-        self.album_list = QListWidget()
-        self.album_list.itemClicked.connect(self.update_album_preview)
-        self.album_list.itemDoubleClicked.connect(self.show_album_detail)
+        self.album_model = RowListModel(self)
+        self.album_list = QListView()
+        self.album_list.setModel(self.album_model)
+        self.album_list.clicked.connect(self.update_album_preview)
+        self.album_list.doubleClicked.connect(self.show_album_detail)
         self.album_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.album_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        self.album_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.album_list.setUniformItemSizes(True)
         left_col.addWidget(self.album_list)
 
         preview = QWidget()
@@ -520,13 +1038,13 @@ class MusicPlayerApp(QWidget):
         self.album_preview_title = QLabel("Select an album")
         self.album_preview_title.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.album_preview_title.setWordWrap(True)
-        self.album_preview_title.setStyleSheet("font-size: 13px; font-weight: 600;")
+        self.album_preview_title.setObjectName("preview_title")
         preview_layout.addWidget(self.album_preview_title)
 
         self.album_preview_artist = QLabel("")
         self.album_preview_artist.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.album_preview_artist.setWordWrap(True)
-        self.album_preview_artist.setStyleSheet("font-size: 11px; color: #666;")
+        self.album_preview_artist.setObjectName("preview_artist")
         preview_layout.addWidget(self.album_preview_artist)
 
         preview_layout.addStretch()
@@ -546,13 +1064,8 @@ class MusicPlayerApp(QWidget):
         
         preview_layout.addLayout(preview_actions)
 
-        now_playing = self.create_now_playing_sidebar()
-
         self.album_side_stack = QStackedWidget()
         self.album_side_stack.addWidget(preview)
-        self.album_side_stack.addWidget(now_playing)
-        self.album_side_stack.setCurrentIndex(0)
-        self.side_stacks.append(self.album_side_stack)
 
         self.album_preview_album = None
         self.set_album_preview(None, self.album_preview_art,
@@ -564,11 +1077,10 @@ class MusicPlayerApp(QWidget):
                        "Select an album")
 
         # Pagination footer
-        footer = self.create_pagination_footer(
+        footer, self.album_page_label = self.create_pagination_footer(
             lambda: self.prev_page('albums'),
             lambda: self.next_page('albums')
         )
-        self.album_page_label = footer.findChild(QLabel, "page_label")
         left_col.addWidget(footer)
 
         content.addLayout(left_col, 3)
@@ -596,7 +1108,7 @@ class MusicPlayerApp(QWidget):
 
         self.artists_title_label = QLabel("Artists")
         self.artists_title_label.setAlignment(Qt.AlignCenter)
-        self.artists_title_label.setStyleSheet("font-size: 12px; font-weight: 600;")
+        self.artists_title_label.setObjectName("header_title")
         header_layout.addWidget(self.artists_title_label, 1)
 
         spacer = QLabel()
@@ -611,19 +1123,21 @@ class MusicPlayerApp(QWidget):
         left_col = QVBoxLayout()
         left_col.setSpacing(4)
 
-        self.artist_list = QListWidget()
+        self.artist_model = RowListModel(self)
+        self.artist_list = QListView()
+        self.artist_list.setModel(self.artist_model)
         self.artist_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.artist_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.artist_list.itemClicked.connect(self.handle_artist_item_clicked)
-        self.artist_list.itemDoubleClicked.connect(self.show_album_detail)
+        self.artist_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.artist_list.setUniformItemSizes(True)
+        self.artist_list.clicked.connect(self.handle_artist_item_clicked)
+        self.artist_list.doubleClicked.connect(self.show_album_detail)
         left_col.addWidget(self.artist_list)
 
         # Pagination footer
-        footer = self.create_pagination_footer(
+        footer, self.artist_page_label = self.create_pagination_footer(
             lambda: self.prev_page('artists'),
             lambda: self.next_page('artists')
         )
-        self.artist_page_label = footer.findChild(QLabel, "page_label")
         self.artist_footer = footer
         left_col.addWidget(footer)
 
@@ -647,11 +1161,14 @@ class MusicPlayerApp(QWidget):
         left_col = QVBoxLayout()
         left_col.setSpacing(4)
 
-        self.favorites_list = QListWidget()
-        self.favorites_list.itemClicked.connect(self.update_favorites_preview)
-        self.favorites_list.itemDoubleClicked.connect(self.show_album_detail)
+        self.favorites_model = RowListModel(self)
+        self.favorites_list = QListView()
+        self.favorites_list.setModel(self.favorites_model)
+        self.favorites_list.clicked.connect(self.update_favorites_preview)
+        self.favorites_list.doubleClicked.connect(self.show_album_detail)
         self.favorites_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.favorites_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        self.favorites_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.favorites_list.setUniformItemSizes(True)
         left_col.addWidget(self.favorites_list)
 
         preview = QWidget()
@@ -667,13 +1184,13 @@ class MusicPlayerApp(QWidget):
         self.favorites_preview_title = QLabel("Select a favorite")
         self.favorites_preview_title.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.favorites_preview_title.setWordWrap(True)
-        self.favorites_preview_title.setStyleSheet("font-size: 13px; font-weight: 600;")
+        self.favorites_preview_title.setObjectName("preview_title")
         preview_layout.addWidget(self.favorites_preview_title)
 
         self.favorites_preview_artist = QLabel("")
         self.favorites_preview_artist.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.favorites_preview_artist.setWordWrap(True)
-        self.favorites_preview_artist.setStyleSheet("font-size: 11px; color: #666;")
+        self.favorites_preview_artist.setObjectName("preview_artist")
         preview_layout.addWidget(self.favorites_preview_artist)
 
         preview_layout.addStretch()
@@ -693,13 +1210,8 @@ class MusicPlayerApp(QWidget):
         
         preview_layout.addLayout(preview_actions)
 
-        now_playing = self.create_now_playing_sidebar()
-
         self.favorites_side_stack = QStackedWidget()
         self.favorites_side_stack.addWidget(preview)
-        self.favorites_side_stack.addWidget(now_playing)
-        self.favorites_side_stack.setCurrentIndex(0)
-        self.side_stacks.append(self.favorites_side_stack)
 
         self.favorites_preview_album = None
         self.set_album_preview(None, self.favorites_preview_art,
@@ -711,11 +1223,10 @@ class MusicPlayerApp(QWidget):
                        "Select a favorite")
 
         # Pagination footer
-        footer = self.create_pagination_footer(
+        footer, self.favorites_page_label = self.create_pagination_footer(
             lambda: self.prev_page('favorites'),
             lambda: self.next_page('favorites')
         )
-        self.favorites_page_label = footer.findChild(QLabel, "page_label")
         left_col.addWidget(footer)
 
         content.addLayout(left_col, 3)
@@ -743,31 +1254,31 @@ class MusicPlayerApp(QWidget):
 
         self.detail_album_label = QLabel("")
         self.detail_album_label.setAlignment(Qt.AlignCenter)
-        self.detail_album_label.setStyleSheet(
-            "font-size: 11px; font-weight: 600;"
-        )
+        self.detail_album_label.setObjectName("detail_title")
         h.addWidget(self.detail_album_label, 1)
 
         self.favorite_btn = QPushButton("♡")
         self.favorite_btn.setFixedWidth(40)
-        self.favorite_btn.setStyleSheet("font-size: 16px;")
+        self.favorite_btn.setObjectName("favorite")
         self.favorite_btn.clicked.connect(self.toggle_favorite)
         h.addWidget(self.favorite_btn)
 
         layout.addWidget(header)
 
-        self.track_list = QListWidget()
+        self.track_model = RowListModel(self)
+        self.track_list = QListView()
+        self.track_list.setModel(self.track_model)
         self.track_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.track_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.track_list.itemClicked.connect(self.play_selected_track)
+        self.track_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.track_list.setUniformItemSizes(True)
+        self.track_list.clicked.connect(self.play_selected_track)
         layout.addWidget(self.track_list)
 
         # Pagination footer
-        footer = self.create_pagination_footer(
+        footer, self.track_page_label = self.create_pagination_footer(
             lambda: self.prev_page('tracks'),
             lambda: self.next_page('tracks')
         )
-        self.track_page_label = footer.findChild(QLabel, "page_label")
         layout.addWidget(footer)
 
         return page
@@ -806,15 +1317,13 @@ class MusicPlayerApp(QWidget):
         self.track_label = QLabel("No track")
         self.track_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.track_label.setWordWrap(True)
-        self.track_label.setStyleSheet(
-            "font-size: 14px; font-weight: 600; padding-right: 6px;"
-        )
+        self.track_label.setObjectName("now_playing_title")
         right_col.addWidget(self.track_label)
 
         self.artist_label = QLabel("")
         self.artist_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.artist_label.setWordWrap(True)
-        self.artist_label.setStyleSheet("font-size: 11px; color: #666;")
+        self.artist_label.setObjectName("preview_artist")
         right_col.addWidget(self.artist_label)
 
         right_col.addStretch()
@@ -830,7 +1339,7 @@ class MusicPlayerApp(QWidget):
 
         self.time_label = QLabel("0:00 / 0:00")
         self.time_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.time_label.setStyleSheet("font-size: 10px; color: #888;")
+        self.time_label.setObjectName("time_label")
         slider_layout.addWidget(self.time_label)
 
         right_col.addWidget(slider_container)
@@ -846,11 +1355,9 @@ class MusicPlayerApp(QWidget):
         self.play_btn.setFixedSize(54, 40)
         self.next_btn.setFixedSize(44, 36)
 
-        self.prev_btn.setStyleSheet("border-radius: 18px; font-size: 13px;")
-        self.play_btn.setStyleSheet("border-radius: 20px; font-size: 15px;")
-        self.next_btn.setStyleSheet("border-radius: 18px; font-size: 13px;")
-
-        self.play_btn.setObjectName("accent")
+        self.prev_btn.setObjectName("transport")
+        self.play_btn.setObjectName("play")
+        self.next_btn.setObjectName("transport")
 
         self.prev_btn.clicked.connect(self.prev_track)
         self.play_btn.clicked.connect(self.toggle_play)
@@ -872,32 +1379,90 @@ class MusicPlayerApp(QWidget):
 
     # ---------- Music scan ----------
     def scan_music_library(self):
+        """Start scanning the library in a background thread.
+
+        Lists fill in as batches arrive, so the UI is usable immediately.
+        """
         if not os.path.isdir(self.music_root):
             return
 
-        for root, _, files in os.walk(self.music_root):
-            for file in files:
-                if file.lower().endswith(('.flac', '.mp3', '.m4a', '.ogg')):
-                    path = os.path.join(root, file)
-                    meta = self.get_metadata(path)
-
-                    album = meta['album']
-                    artist = meta['artist']
+        self.scan_thread = QThread(self)
+        self.scan_worker = ScannerWorker(self.music_root,
+                                         self.load_library_cache,
+                                         self.get_metadata,
+                                         self.save_library_cache)
+        self.scan_worker.moveToThread(self.scan_thread)
+        self.scan_thread.started.connect(self.scan_worker.run)
+        self.scan_worker.batch_ready.connect(self.ingest_scan_batch)
+        self.scan_worker.finished.connect(self.on_scan_finished)
+        self.scan_worker.finished.connect(self.scan_thread.quit)
+        self.landing_tagline.setText("Scanning library…")
+        self.scan_thread.start()
+
+    def ingest_scan_batch(self, batch):
+        touched = set()
+        new_albums = []
+        new_artists = []
+        for path, _, meta in batch:
+            self.track_metadata[path] = meta
+
+            album = meta['album']
+            artist = meta['artist']
+
+            if album not in self.albums:
+                new_albums.append(album)
+                self.album_labels[album] = f"{album}\n{artist}"
+            if artist not in self.artists:
+                new_artists.append(artist)
+
+            # (path, title, track) so album views need no metadata lookups
+            self.albums.setdefault(album, []).append(
+                (path, meta['title'], meta['track'])
+            )
+            # The first track seen names the album's artist and art source
+            self.album_artists.setdefault(album, artist)
+            self.album_art_paths.setdefault(album, path)
+            touched.add(album)
+
+            artist_albums = self.artists.setdefault(artist, set())
+            if album not in artist_albums:
+                artist_albums.add(album)
+                self.artist_album_rows.pop(artist, None)
+
+        for album in touched:
+            # Track number, then path so untagged tracks keep filename order
+            self.albums[album].sort(key=lambda t: (t[2], t[0]))
+
+        self.refresh_lists(new_albums, new_artists)
+        self.landing_tagline.setText(
+            f"Scanning library… {len(self.track_metadata)} tracks"
+        )
 
-                    self.albums.setdefault(album, []).append(path)
-                    self.album_metadata.setdefault(album, {
-                        'artist': artist,
-                        'art': meta.get('art')
-                    })
+    def on_scan_finished(self):
+        self.landing_tagline.setText("Your library, wide view")
 
-                    self.artists.setdefault(artist, [])
-                    if album not in self.artists[artist]:
-                        self.artists[artist].append(album)
+    # ---------- Library cache ----------
+    def load_library_cache(self):
+        """Return the cached {path: {'stamp', 'meta'}} entries, if any."""
+        try:
+            with open(self.library_cache_file, "rb") as f:
+                return load_json(f.read()).get('tracks', {})
+        except Exception:
+            return {}
 
-        for album in self.albums:
-            self.albums[album].sort(key=self.get_track_number)
+    def save_library_cache(self, scanned):
+        """Write (path, stamp, meta) entries from a finished scan to disk."""
+        tracks = {
+            path: {'stamp': stamp, 'meta': meta}
+            for path, stamp, meta in scanned
+        }
 
-        self.populate_lists()
+        try:
+            # Encode up front so the file gets one write, not json.dump's
+            # stream of small chunks
+            write_atomic(self.library_cache_file, dump_json({'tracks': tracks}))
+        except Exception:
+            pass
 
     # ---------- Metadata ----------
     def get_metadata(self, path):
@@ -905,96 +1470,51 @@ class MusicPlayerApp(QWidget):
             'title': 'Unknown',
             'artist': 'Unknown Artist',
             'album': 'Unknown Album',
-            'track': 0,
-            'art': None
+            'track': 0
         }
 
+        # Open with the format's own class instead of letting File() sniff it.
+        # For MP3 only the ID3 tag is read; MP3() would also parse the stream.
+        ext = os.path.splitext(path)[1].lower()
         try:
-            audio = File(path)
+            if ext == '.flac':
+                audio = FLAC(path)
+            elif ext == '.mp3':
+                audio = ID3(path)
+            elif ext == '.m4a':
+                audio = EasyMP4(path)
+            else:
+                # Ogg via mutagen's easy interface, which uses FLAC-style keys
+                audio = File(path, easy=True)
+
+            if isinstance(audio, ID3):
+                meta['title'] = id3_text(audio, 'TIT2', 'Unknown')
+                meta['artist'] = id3_text(audio, 'TPE1', 'Unknown Artist')
+                meta['album'] = id3_text(audio, 'TALB', 'Unknown Album')
+
+                track_num = id3_text(audio, 'TRCK', '0')
+                try:
+                    # Handle "1/10" format
+                    meta['track'] = int(str(track_num).split('/')[0])
+                except (ValueError, IndexError):
+                    meta['track'] = 0
 
-            if isinstance(audio, FLAC):
+            elif audio is not None:
                 meta['title'] = audio.get('title', ['Unknown'])[0]
                 meta['artist'] = audio.get('artist', ['Unknown Artist'])[0]
                 meta['album'] = audio.get('album', ['Unknown Album'])[0]
-                # FIX: Extract track number from FLAC
                 track_num = audio.get('tracknumber', ['0'])[0]
                 try:
                     # Handle "1/10" format
                     meta['track'] = int(str(track_num).split('/')[0])
                 except (ValueError, IndexError):
                     meta['track'] = 0
-                
-                if audio.pictures:
-                    meta['art'] = audio.pictures[0].data
-
-            elif isinstance(audio, MP3):
-                # FIX: Properly access MP3 ID3 tags
-                meta['title'] = str(audio.get('TIT2', 'Unknown'))
-                if 'TIT2' in audio and hasattr(audio['TIT2'], 'text'):
-                    meta['title'] = audio['TIT2'].text[0]
-
-                meta['artist'] = str(audio.get('TPE1', 'Unknown Artist'))
-                if 'TPE1' in audio and hasattr(audio['TPE1'], 'text'):
-                    meta['artist'] = audio['TPE1'].text[0]
-
-                meta['album'] = str(audio.get('TALB', 'Unknown Album'))
-                if 'TALB' in audio and hasattr(audio['TALB'], 'text'):
-                    meta['album'] = audio['TALB'].text[0]
-                
-                # FIX: Extract track number from MP3
-                if 'TRCK' in audio and hasattr(audio['TRCK'], 'text'):
-                    track_num = audio['TRCK'].text[0]
-                    try:
-                        meta['track'] = int(str(track_num).split('/')[0])
-                    except (ValueError, IndexError):
-                        meta['track'] = 0
-                
-                # FIX: Extract album art from MP3
-                if audio.tags:
-                    apic_frames = audio.tags.getall('APIC')
-                    if apic_frames:
-                        meta['art'] = apic_frames[0].data
-
-            if meta['art'] is None:
-                meta['art'] = self.load_folder_art(path)
 
         except Exception:
             pass
 
         return meta
 
-    def load_folder_art(self, path):
-        folder = os.path.dirname(path)
-        candidates = [
-            "cover.jpg", "cover.png",
-            "folder.jpg", "folder.png",
-            "front.jpg", "front.png",
-            "album.jpg", "album.png",
-            "artwork.jpg", "artwork.png"
-        ]
-
-        try:
-            entries = os.listdir(folder)
-        except Exception:
-            return None
-
-        lookup = {name.lower(): name for name in entries}
-        for name in candidates:
-            actual = lookup.get(name)
-            if not actual:
-                continue
-            file_path = os.path.join(folder, actual)
-            try:
-                with open(file_path, "rb") as f:
-                    return f.read()
-            except Exception:
-                continue
-
-        return None
-
-    def get_track_number(self, path):
-        return self.get_metadata(path).get('track', 999)
-
     # ---------- Pagination ----------
     def prev_page(self, list_type):
         if list_type == 'albums' and self.album_page > 0:
@@ -1003,8 +1523,8 @@ class MusicPlayerApp(QWidget):
         elif list_type == 'artists' and self.artist_page > 0:
             self.artist_page -= 1
             self.update_artist_page()
-        elif list_type == 'favorites' and self.favorites_page > 0:
-            self.favorites_page -= 1
+        elif list_type == 'favorites' and self.favorites_page_index > 0:
+            self.favorites_page_index -= 1
             self.update_favorites_page()
         elif list_type == 'tracks' and self.track_page > 0:
             self.track_page -= 1
@@ -1022,10 +1542,9 @@ class MusicPlayerApp(QWidget):
                 self.artist_page += 1
                 self.update_artist_page()
         elif list_type == 'favorites':
-            fav_albums = [a for a in self.favorites if a in self.albums]
-            max_page = (len(fav_albums) - 1) // self.favorites_per_page if fav_albums else 0
-            if self.favorites_page < max_page:
-                self.favorites_page += 1
+            max_page = (len(self.all_favorites) - 1) // self.favorites_per_page if self.all_favorites else 0
+            if self.favorites_page_index < max_page:
+                self.favorites_page_index += 1
                 self.update_favorites_page()
         elif list_type == 'tracks':
             max_page = (len(self.all_tracks_data) - 1) // self.tracks_per_page
@@ -1034,31 +1553,46 @@ class MusicPlayerApp(QWidget):
                 self.update_track_page()
 
     # ---------- Lists ----------
-    def populate_lists(self):
-        self.all_albums = sorted(self.albums.keys())
-        self.all_artists = sorted(self.artists.keys())
-        self.album_page = 0
-        self.artist_page = 0
-        self.favorites_page = 0
+    def refresh_lists(self, new_albums, new_artists):
+        """Pick up newly scanned entries, re-rendering only pages whose rows changed."""
+        if new_albums:
+            start = self.album_page * self.albums_per_page
+            end = start + self.albums_per_page
+            visible = self.all_albums[start:end]
+            self.all_albums = sorted(self.albums.keys())
+            if self.all_albums[start:end] != visible:
+                self.update_album_page()
+            else:
+                self.update_album_page_label()
 
-        self.update_album_page()
-        self.update_artist_page()
-        self.update_favorites_page()
+            new_favorites = [album for album in new_albums if album in self.favorites]
+            for album in new_favorites:
+                bisect.insort(self.all_favorites, album)
+            if new_favorites:
+                self.update_favorites_page()
+
+        if new_artists:
+            start = self.artist_page * self.artists_per_page
+            end = start + self.artists_per_page
+            visible = self.all_artists[start:end]
+            self.all_artists = sorted(self.artists.keys())
+            if self.artist_list_mode == "artists" and self.all_artists[start:end] != visible:
+                self.update_artist_page()
+            else:
+                self.update_artist_page_label()
+
+    def album_rows(self, albums):
+        labels = self.album_labels
+        return [(labels[album], album) for album in albums]
 
     def update_album_page(self):
-        self.album_list.clear()
         start = self.album_page * self.albums_per_page
         end = start + self.albums_per_page
         page_albums = self.all_albums[start:end]
 
-        for album in page_albums:
-            artist = self.album_metadata[album]['artist']
-            item = QListWidgetItem(f"{album}\n{artist}")
-            item.setData(Qt.UserRole, album)
-            self.album_list.addItem(item)
+        self.album_model.set_rows(self.album_rows(page_albums))
 
-        total_pages = max(1, (len(self.all_albums) + self.albums_per_page - 1) // self.albums_per_page)
-        self.album_page_label.setText(f"Page {self.album_page + 1}/{total_pages}")
+        self.update_album_page_label()
 
         if hasattr(self, "album_preview_art"):
             self.album_preview_album = None
@@ -1071,38 +1605,35 @@ class MusicPlayerApp(QWidget):
                                    "Select an album")
 
     def update_artist_page(self):
-        self.artist_list.clear()
         start = self.artist_page * self.artists_per_page
         end = start + self.artists_per_page
         page_artists = self.all_artists[start:end]
 
-        for artist in page_artists:
-            item = QListWidgetItem(artist)
-            item.setData(Qt.UserRole, artist)
-            self.artist_list.addItem(item)
+        # The artist name is both the row text and its data
+        self.artist_model.set_rows(list(zip(page_artists, page_artists)))
 
-        total_pages = max(1, (len(self.all_artists) + self.artists_per_page - 1) // self.artists_per_page)
-        self.artist_page_label.setText(f"Page {self.artist_page + 1}/{total_pages}")
+        self.update_artist_page_label()
         self.artist_list_mode = "artists"
         if hasattr(self, "artists_title_label"):
             self.artists_title_label.setText("Artists")
 
-    def update_favorites_page(self):
-        self.favorites_list.clear()
-        fav_albums = [a for a in self.favorites if a in self.albums]
+    def update_album_page_label(self):
+        total_pages = max(1, (len(self.all_albums) + self.albums_per_page - 1) // self.albums_per_page)
+        self.album_page_label.setText(f"Page {self.album_page + 1}/{total_pages}")
+
+    def update_artist_page_label(self):
+        total_pages = max(1, (len(self.all_artists) + self.artists_per_page - 1) // self.artists_per_page)
+        self.artist_page_label.setText(f"Page {self.artist_page + 1}/{total_pages}")
 
-        start = self.favorites_page * self.favorites_per_page
+    def update_favorites_page(self):
+        start = self.favorites_page_index * self.favorites_per_page
         end = start + self.favorites_per_page
-        page_favorites = fav_albums[start:end]
+        page_favorites = self.all_favorites[start:end]
 
-        for album in page_favorites:
-            artist = self.album_metadata[album]['artist']
-            item = QListWidgetItem(f"{album}\n{artist}")
-            item.setData(Qt.UserRole, album)
-            self.favorites_list.addItem(item)
+        self.favorites_model.set_rows(self.album_rows(page_favorites))
 
-        total_pages = max(1, (len(fav_albums) + self.favorites_per_page - 1) // self.favorites_per_page)
-        self.favorites_page_label.setText(f"Page {self.favorites_page + 1}/{total_pages}")
+        total_pages = max(1, (len(self.all_favorites) + self.favorites_per_page - 1) // self.favorites_per_page)
+        self.favorites_page_label.setText(f"Page {self.favorites_page_index + 1}/{total_pages}")
 
         self.favorites_preview_album = None
         self.set_album_preview(None, self.favorites_preview_art,
@@ -1114,15 +1645,11 @@ class MusicPlayerApp(QWidget):
                                "Select a favorite")
 
     def update_track_page(self):
-        self.track_list.clear()
         start = self.track_page * self.tracks_per_page
         end = start + self.tracks_per_page
         page_tracks = self.all_tracks_data[start:end]
 
-        for track_idx, track_title in page_tracks:
-            item = QListWidgetItem(track_title)
-            item.setData(Qt.UserRole, track_idx)
-            self.track_list.addItem(item)
+        self.track_model.set_rows([(title, idx) for idx, title in page_tracks])
 
         total_pages = max(1, (len(self.all_tracks_data) + self.tracks_per_page - 1) // self.tracks_per_page)
         self.track_page_label.setText(f"Page {self.track_page + 1}/{total_pages}")
@@ -1130,7 +1657,7 @@ class MusicPlayerApp(QWidget):
     # ---------- Navigation ----------
     def show_albums_page(self):
         """Navigate to albums page and reset to show all albums"""
-        self.all_albums = sorted(self.albums.keys())
+        # all_albums is kept sorted by refresh_lists as the scan adds albums
         self.album_page = 0
         self.update_album_page()
         self.stack.setCurrentIndex(1)
@@ -1141,39 +1668,38 @@ class MusicPlayerApp(QWidget):
         self.current_album = album
         self.current_tracks = self.albums[album]
 
-        artist = self.album_metadata[album]['artist']
-        self.detail_album_label.setText(f"{album}\n{artist}")
+        self.detail_album_label.setText(self.album_labels[album])
 
         # FIX: Update favorite button to show current state
         self.update_favorite_button()
 
         # Build track data for pagination
         self.all_tracks_data = []
-        for i, path in enumerate(self.current_tracks):
-            meta = self.get_metadata(path)
-            self.all_tracks_data.append((i, f"{i+1}. {meta['title']}"))
+        for i, (_, title, _) in enumerate(self.current_tracks):
+            self.all_tracks_data.append((i, f"{i+1}. {title}"))
 
         self.track_page = 0
         self.update_track_page()
 
+        # Remember which list opened the album so Back returns there as-is
+        if self.stack.currentIndex() != 4:
+            self.detail_return_index = self.stack.currentIndex()
         self.stack.setCurrentIndex(4)
 
-    def show_album_detail(self, item):
-        self.open_album(item.data(Qt.UserRole))
+    def show_album_detail(self, index):
+        self.open_album(index.data(Qt.UserRole))
 
-    def show_artist_albums(self, item):
-        artist = item.data(Qt.UserRole)
+    def show_artist_albums(self, index):
+        artist = index.data(Qt.UserRole)
         self.artist_list_mode = "albums"
         self.current_artist = artist
         if hasattr(self, "artists_title_label"):
             self.artists_title_label.setText(f"Albums • {artist}")
-        self.artist_list.clear()
-
-        for album in self.artists[artist]:
-            art = self.album_metadata[album]['artist']
-            it = QListWidgetItem(f"{album}\n{art}")
-            it.setData(Qt.UserRole, album)
-            self.artist_list.addItem(it)
+        rows = self.artist_album_rows.get(artist)
+        if rows is None:
+            rows = self.album_rows(sorted(self.artists[artist]))
+            self.artist_album_rows[artist] = rows
+        self.artist_model.set_rows(rows)
 
         if hasattr(self, "artist_footer"):
             self.artist_footer.setVisible(False)
@@ -1193,44 +1719,61 @@ class MusicPlayerApp(QWidget):
         else:
             self.stack.setCurrentIndex(0)
 
-    def handle_artist_item_clicked(self, item):
+    def handle_artist_item_clicked(self, index):
         if self.artist_list_mode == "artists":
-            self.show_artist_albums(item)
+            self.show_artist_albums(index)
         else:
-            self.show_album_detail(item)
+            self.show_album_detail(index)
 
     def go_back_from_detail(self):
-        self.show_albums_page()
+        self.stack.setCurrentIndex(self.detail_return_index)
 
     def set_album_preview(self, album, art_label, title_label, artist_label,
                           play_btn, tracks_btn, size, empty_title):
-        if not album or album not in self.album_metadata:
+        if album not in self.album_artists:
+            album = None
+        # Paging re-clears the preview each time; skip if it already shows this
+        if self.art_targets.get(art_label) == (album, size):
+            return
+
+        if album is None:
             title_label.setText(empty_title)
             artist_label.setText("")
             play_btn.setEnabled(False)
             tracks_btn.setEnabled(False)
-            self.set_preview_art(art_label, None, size)
+            self.set_preview_art(art_label, None, None, size)
             return
 
-        meta = self.album_metadata[album]
+        art_path = self.album_art_paths[album]
         title_label.setText(album)
-        artist_label.setText(meta.get('artist', 'Unknown Artist'))
-        self.set_preview_art(art_label, meta.get('art'), size)
+        artist_label.setText(self.album_artists[album])
+        self.set_preview_art(art_label, album, art_path, size)
         play_btn.setEnabled(True)
         tracks_btn.setEnabled(True)
 
-    def set_preview_art(self, target_label, art, size):
-        if art:
-            pix = QPixmap()
-            pix.loadFromData(art)
-            target_label.setPixmap(
-                pix.scaled(size, size, Qt.KeepAspectRatio,
-                           Qt.SmoothTransformation)
-            )
+        # Playing is the likely next step; get its art sizes ready meanwhile
+        self.prefetch_art(album, art_path)
+
+    def set_preview_art(self, target_label, album, path, size):
+        # The latest request wins, so art decoded for an album the user has
+        # already moved past never replaces the current one
+        self.art_targets[target_label] = (album, size)
+        if path and (album, size) not in self.art_cache:
+            target_label.setPixmap(self.render_placeholder_pixmap(size))
+            self.request_art(album, path, [size])
+            return
+
+        pix = self.album_art_pixmap(album, size) if path else None
+        if pix is not None:
+            target_label.setPixmap(pix)
         else:
             target_label.setPixmap(self.render_placeholder_pixmap(size))
 
     def render_placeholder_pixmap(self, size):
+        pix = self.placeholder_cache.get(size)
+        if pix is not None:
+            return pix
+
         pix = QPixmap(size, size)
         pix.fill(QColor("#f0f0f0"))
 
@@ -1244,10 +1787,11 @@ class MusicPlayerApp(QWidget):
         painter.drawText(0, 0, size, size, Qt.AlignCenter, "♪")
         painter.end()
 
+        self.placeholder_cache[size] = pix
         return pix
 
-    def update_album_preview(self, item):
-        album = item.data(Qt.UserRole)
+    def update_album_preview(self, index):
+        album = index.data(Qt.UserRole)
         self.album_preview_album = album
         self.set_album_preview(album, self.album_preview_art,
                        self.album_preview_title,
@@ -1257,8 +1801,8 @@ class MusicPlayerApp(QWidget):
                        160,
                        "Select an album")
 
-    def update_favorites_preview(self, item):
-        album = item.data(Qt.UserRole)
+    def update_favorites_preview(self, index):
+        album = index.data(Qt.UserRole)
         self.favorites_preview_album = album
         self.set_album_preview(album, self.favorites_preview_art,
                        self.favorites_preview_title,
@@ -1295,8 +1839,8 @@ class MusicPlayerApp(QWidget):
             self.stack.setCurrentIndex(5)
 
     # ---------- Playback ----------
-    def play_selected_track(self, item):
-        self.play_track(item.data(Qt.UserRole))
+    def play_selected_track(self, index):
+        self.play_track(index.data(Qt.UserRole))
         self.stack.setCurrentIndex(5)
 
     def play_track(self, index):
@@ -1304,9 +1848,10 @@ class MusicPlayerApp(QWidget):
             return
 
         self.current_index = index
-        self.track_ending = False  # FIX: Reset flag when playing new track
         self.is_playing_music = True
-        path = self.current_tracks[index]
+        self.shown_length = -1
+        self.shown_second = -1
+        path = self.current_tracks[index][0]
 
         media = self.instance.media_new(path)
         self.player.set_media(media)
@@ -1316,52 +1861,99 @@ class MusicPlayerApp(QWidget):
         self.update_now_playing(path)
 
     def update_now_playing(self, path):
-        meta = self.get_metadata(path)
+        meta = self.track_metadata.get(path) or self.get_metadata(path)
         self.track_label.setText(meta['title'])
         self.artist_label.setText(f"{meta['artist']} • {meta['album']}")
 
-        art = meta.get('art')
-        size = self.album_art.width()
-
-        if art:
-            pix = QPixmap()
-            pix.loadFromData(art)
-            self.album_art.setPixmap(
-                pix.scaled(size, size, Qt.KeepAspectRatio,
-                           Qt.SmoothTransformation)
-            )
-        else:
-            self.set_placeholder_art(size)
+        self.set_preview_art(self.album_art, meta['album'], path, self.album_art.width())
 
-        self.update_now_playing_sidebars(meta)
+        self.update_now_playing_sidebar(path, meta)
         self.update_side_views()
 
-    def set_placeholder_art(self, size):
-        self.album_art.setPixmap(self.render_placeholder_pixmap(size))
-
-    def update_now_playing_sidebars(self, meta):
-        track = meta.get('title', 'Unknown')
+    def update_now_playing_sidebar(self, path, meta):
         artist = meta.get('artist', 'Unknown Artist')
         album = meta.get('album', 'Unknown Album')
-        art = meta.get('art')
 
-        for sidebar in self.now_playing_sidebars:
-            sidebar['track'].setText(track)
-            sidebar['artist'].setText(f"{artist} • {album}")
-            size = sidebar['art'].width() or 56
-            self.set_preview_art(sidebar['art'], art, size)
+        self.sidebar_track.setText(meta.get('title', 'Unknown'))
+        self.sidebar_artist.setText(f"{artist} • {album}")
+        self.set_preview_art(self.sidebar_art, album, path, self.sidebar_art.width())
+
+    def dock_now_playing_sidebar(self, index=None):
+        """Move the shared now-playing sidebar into the visible page's side stack."""
+        side_stack = self.side_stacks.get(self.stack.currentWidget())
+        if side_stack is None:
+            return
+
+        if side_stack.indexOf(self.now_playing_sidebar) == -1:
+            previous = self.now_playing_sidebar.parentWidget()
+            if isinstance(previous, QStackedWidget):
+                previous.removeWidget(self.now_playing_sidebar)
+            side_stack.addWidget(self.now_playing_sidebar)
+        # Playback may have stopped or started while another page was showing
+        self.update_side_views()
+
+    def album_art_pixmap(self, album, size):
+        """Return the cached art for (album, size) and mark it recently used.
+
+        Returns None when the album has no art or it is not cached yet;
+        request_art fills the cache.
+        """
+        key = (album, size)
+        if key not in self.art_cache:
+            return None
+        self.art_cache.move_to_end(key)
+        return self.art_cache[key]
+
+    def store_art(self, key, pix):
+        self.art_cache[key] = pix
+        self.art_cache.move_to_end(key)
+        if len(self.art_cache) > self.art_cache_size:
+            self.art_cache.popitem(last=False)
+
+    def prefetch_art(self, album, path):
+        """Warm the art cache for the now-playing sizes."""
+        self.request_art(album, path, {self.album_art.width(), self.sidebar_art.width()})
+
+    def request_art(self, album, path, sizes):
+        """Decode and scale album art on a pool thread; see on_art_loaded."""
+        sizes = [
+            size for size in sizes
+            if (album, size) not in self.art_cache
+            and (album, size) not in self.art_loading
+        ]
+        if not sizes:
+            return
+
+        self.art_loading.update((album, size) for size in sizes)
+        task = ArtPrefetchTask(album, path, sizes)
+        task.signals.loaded.connect(self.on_art_loaded)
+        QThreadPool.globalInstance().start(task)
+
+    def on_art_loaded(self, album, images):
+        pixmaps = {}
+        for size, image in images.items():
+            self.art_loading.discard((album, size))
+            pix = QPixmap.fromImage(image) if image is not None else None
+            self.store_art((album, size), pix)
+            pixmaps[size] = pix
+
+        for label, (wanted_album, size) in self.art_targets.items():
+            if wanted_album == album and size in pixmaps:
+                pix = pixmaps[size]
+                label.setPixmap(pix if pix is not None else self.render_placeholder_pixmap(size))
 
     def update_side_views(self):
-        """Update all sidebar stacks based on playback state"""
+        """Update the visible page's sidebar stack based on playback state"""
+        side_stack = self.side_stacks.get(self.stack.currentWidget())
+        if side_stack is None:
+            return
         show_now_playing = self.is_playing_music and (self.player.is_playing() or self.player.get_state() == vlc.State.Paused)
-        for stack in self.side_stacks:
-            stack.setCurrentIndex(1 if show_now_playing else 0)
+        side_stack.setCurrentIndex(1 if show_now_playing else 0)
 
     def set_play_button_state(self, is_playing):
         text = "⏸" if is_playing else "▶"
         self.play_btn.setText(text)
-        for btn in self.sidebar_play_buttons:
-            btn.setText(text)
+        self.sidebar_play_btn.setText(text)
 
     def toggle_play(self):
         if self.player.is_playing():
@@ -1385,39 +1977,65 @@ class MusicPlayerApp(QWidget):
         self.play_track((self.current_index - 1) % len(self.current_tracks))
 
     # ---------- Progress ----------
-    def update_progress(self):
-        length = self.player.get_length()
-        if length <= 0:
+    def on_vlc_time_changed(self, event):
+        # Runs on libVLC's thread, which reports time far more often than the
+        # progress bar needs; forward at most one update per 250 ms
+        cur = event.u.new_time
+        tick = cur // 250
+        if tick != self.time_tick:
+            self.time_tick = tick
+            self.time_changed.emit(cur)
+
+    def update_progress(self, cur):
+        # Length is fixed per track and the label only shows whole seconds,
+        # so only touch the widgets when what they display would change
+        if self.shown_length <= 0:
+            length = self.player.get_length()
+            if length <= 0:
+                return
+            self.shown_length = length
+            self.progress.setMaximum(length)
+            self.length_text = self.format_time(length)
+
+        # The slider and time label only live on the now playing page;
+        # refresh_progress catches them up when it is shown again
+        if self.stack.currentWidget() is not self.now_playing_page:
+            self.shown_second = -1
             return
 
-        self.progress.setMaximum(length)
-        cur = self.player.get_time()
-        self.progress.setValue(cur)
+        if not self.progress.isSliderDown():
+            self.progress.setValue(cur)
 
-        self.time_label.setText(
-            f"{self.format_time(cur)} / {self.format_time(length)}"
-        )
+        second = cur // 1000
+        if second != self.shown_second:
+            self.shown_second = second
+            self.time_label.setText(
+                f"{self.format_time(cur)} / {self.length_text}"
+            )
 
-        # FIX: Prevent duplicate auto-advance with flag
-        if cur >= length - 500 and self.player.is_playing() and not self.track_ending:
-            self.track_ending = True
-            self.next_track()
+    def refresh_progress(self, index=None):
+        # Time events only arrive while playing, so a paused track would
+        # otherwise show wherever the slider was when the page was left
+        if self.is_playing_music and self.stack.currentWidget() is self.now_playing_page:
+            self.update_progress(self.player.get_time())
 
     def format_time(self, ms):
-        s = ms // 1000
-        return f"{s//60}:{s%60:02d}"
+        return format_seconds(ms // 1000)
 
     def seek(self, value):
         self.player.set_time(value)
 
     # ---------- Favorites ----------
     def toggle_favorite(self):
+        # current_album is always a scanned album, so it belongs in all_favorites
         if self.current_album in self.favorites:
-            self.favorites.remove(self.current_album)
+            self.favorites.discard(self.current_album)
+            self.all_favorites.remove(self.current_album)
         else:
-            self.favorites.append(self.current_album)
+            self.favorites.add(self.current_album)
+            bisect.insort(self.all_favorites, self.current_album)
 
-        self.save_favorites()
+        self.favorites_save_timer.start(500)
         self.update_favorites_page()
         # FIX: Update button after toggling
         self.update_favorite_button()
@@ -1429,28 +2047,61 @@ class MusicPlayerApp(QWidget):
         else:
             self.favorite_btn.setText("♡")  # Empty heart
 
+    @functools.cached_property
+    def favorites(self):
+        # Read on first use (the first scan batch or album opened), not
+        # while the window is being built
+        return self.load_favorites()
+
     def load_favorites(self):
-        if os.path.exists(self.favorites_file):
-            try:
-                with open(self.favorites_file, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return []
+        try:
+            with open(self.favorites_file, "rb") as f:
+                favorites = set(load_json(f.read()))
+        except (OSError, ValueError, TypeError):
+            # Missing, unreadable or not a JSON list: start empty
+            favorites = set()
+        self.saved_favorites = self.queued_favorites = frozenset(favorites)
+        return favorites
 
     def save_favorites(self):
-        try:
-            with open(self.favorites_file, "w") as f:
-                json.dump(self.favorites, f)
-        except Exception:
-            pass
+        # Toggling an album on and back off leaves nothing to write
+        if self.favorites == self.queued_favorites:
+            return
+        snapshot = self.queued_favorites = frozenset(self.favorites)
+
+        # Serializing a short list is cheap; the disk write happens off the UI thread
+        data = dump_json(sorted(snapshot))
+        task = FileWriteTask(self.favorites_file, data, snapshot)
+        task.signals.finished.connect(self.on_favorites_written)
+        self.save_pool.start(task)
+
+    def on_favorites_written(self, snapshot, ok):
+        if ok:
+            self.saved_favorites = snapshot
+        elif snapshot is self.queued_favorites:
+            # The latest write failed, so the file still holds the last
+            # saved set; the next change must write again
+            self.queued_favorites = self.saved_favorites
+
+    # ---------- Shutdown ----------
+    def closeEvent(self, event):
+        if self.favorites_save_timer.isActive():
+            self.favorites_save_timer.stop()
+            self.save_favorites()
+        self.save_pool.waitForDone()
+        if self.scan_thread is not None and self.scan_thread.isRunning():
+            self.scan_worker.stop()
+            self.scan_thread.quit()
+            self.scan_thread.wait()
+        super().closeEvent(event)
 
     # ---------- Keyboard ----------
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Escape:
-            self.close()
-        elif event.key() == Qt.Key_Space:
-            self.toggle_play()
+        action = self.key_actions.get(event.key())
+        if action is not None:
+            action()
+        else:
+            super().keyPressEvent(event)
 
 
 if __name__ == "__main__":